@@ -1,3 +1,30 @@
 """
 Agent implementations package.
 """
+
+import asyncio
+from typing import Dict
+
+from app.core.config import settings
+
+# Shared by all agents so concurrent battles cannot exceed the provider's limits.
+# Kept per event loop because asyncio primitives must not cross loops.
+_llm_call_limiters: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+
+def get_llm_call_limiter() -> asyncio.Semaphore:
+    """
+    Get the semaphore limiting concurrent LLM requests on the running event loop.
+
+    Returns:
+        asyncio.Semaphore: Limiter sized by the llm_max_concurrency setting
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _llm_call_limiters.get(loop)
+    if limiter is None:
+        for closed_loop in [lp for lp in _llm_call_limiters if lp.is_closed()]:
+            del _llm_call_limiters[closed_loop]
+
+        limiter = asyncio.Semaphore(settings.llm_max_concurrency)
+        _llm_call_limiters[loop] = limiter
+    return limiter
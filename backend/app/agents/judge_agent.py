@@ -3,14 +3,32 @@ Judge agent implementation using LangChain with RAG integration.
 """
 
 import random
+import re
+from functools import lru_cache
 from typing import Tuple
 
+from app.agents import get_llm_call_limiter
 from app.core.config import settings
 from app.services.prompt_service import prompt_service
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 
 
+@lru_cache(maxsize=256)
+def _winner_declaration_pattern(rapper_name: str) -> re.Pattern:
+    """
+    Get the compiled pattern matching a judge's declaration of this rapper as winner.
+
+    Args:
+        rapper_name: Name of the rapper
+
+    Returns:
+        re.Pattern: Case-insensitive pattern for "winner: <name>" or "the winner is <name>"
+    """
+    name = re.escape(rapper_name)
+    return re.compile(f"winner: {name}|the winner is {name}", re.IGNORECASE)
+
+
 class JudgeAgent:
     """Agent for judging rap battles."""
 
@@ -21,6 +39,8 @@ class JudgeAgent:
             temperature=0.4,
             api_key=settings.openai_api_key,
             streaming=False,
+            max_retries=settings.llm_max_retries,
+            timeout=settings.llm_timeout_seconds,
         )
 
         system_prompt = prompt_service.get_judge_system_prompt()
@@ -66,7 +86,8 @@ class JudgeAgent:
                 rapper2_verse=rapper2_verse,
             )
 
-            result = await self.chain.ainvoke({"input": input_text})
+            async with get_llm_call_limiter():
+                result = await self.chain.ainvoke({"input": input_text})
             judgment_text = (
                 result.content if hasattr(result, "content") else str(result)
             )
@@ -99,16 +120,9 @@ class JudgeAgent:
         try:
             winner = rapper1_name
 
-            lower_judgment = judgment.lower()
-            if (
-                f"winner: {rapper1_name.lower()}" in lower_judgment
-                or f"the winner is {rapper1_name.lower()}" in lower_judgment
-            ):
+            if _winner_declaration_pattern(rapper1_name).search(judgment):
                 winner = rapper1_name
-            elif (
-                f"winner: {rapper2_name.lower()}" in lower_judgment
-                or f"the winner is {rapper2_name.lower()}" in lower_judgment
-            ):
+            elif _winner_declaration_pattern(rapper2_name).search(judgment):
                 winner = rapper2_name
 
             return winner, judgment
@@ -8,18 +8,20 @@ import operator
 from langgraph.graph import END, StateGraph
 
 from app.agents.rapper_agent import rapper_agent
+from app.models.verse import PreviousVerse
 
 
 class BattleRoundState(TypedDict):
     """State for a battle round with parallel verse generation."""
 
+    battle_id: str
     round_id: str
     rapper1_name: str
     rapper2_name: str
     style1: str
     style2: str
     round_number: int
-    previous_verses: Optional[List[Dict]]
+    previous_verses: Optional[List[PreviousVerse]]
 
     verses: Annotated[List[Dict], operator.add]
 
@@ -33,12 +35,19 @@ async def rapper1_verse_node(state: BattleRoundState) -> BattleRoundState:
             style=state["style1"],
             round_number=state["round_number"],
             previous_verses=state["previous_verses"],
+            battle_id=state["battle_id"],
         )
     except Exception:
         verse_content = "Error generating verse."
 
     return {
-        "verses": [{"rapper_name": state["rapper1_name"], "content": verse_content}]
+        "verses": [
+            {
+                "side": "rapper1",
+                "rapper_name": state["rapper1_name"],
+                "content": verse_content,
+            }
+        ]
     }
 
 
@@ -51,12 +60,19 @@ async def rapper2_verse_node(state: BattleRoundState) -> BattleRoundState:
             style=state["style2"],
             round_number=state["round_number"],
             previous_verses=state["previous_verses"],
+            battle_id=state["battle_id"],
         )
     except Exception:
         verse_content = "Error generating verse."
 
     return {
-        "verses": [{"rapper_name": state["rapper2_name"], "content": verse_content}]
+        "verses": [
+            {
+                "side": "rapper2",
+                "rapper_name": state["rapper2_name"],
+                "content": verse_content,
+            }
+        ]
     }
 
 
@@ -89,13 +105,14 @@ battle_round_graph = create_battle_round_graph()
 
 
 async def execute_battle_round_parallel(
+    battle_id: str,
     round_id: str,
     rapper1_name: str,
     rapper2_name: str,
     style1: str,
     style2: str,
     round_number: int,
-    previous_verses: Optional[List[Dict]] = None,
+    previous_verses: Optional[List[PreviousVerse]] = None,
 ) -> Dict:
     """
     Execute a battle round with parallel agent execution and tool-based RAG integration.
@@ -104,6 +121,7 @@ async def execute_battle_round_parallel(
     judge the round. Users can manually judge rounds using the API endpoints.
 
     Args:
+        battle_id: ID of the battle
         round_id: ID of the round
         rapper1_name: Name of the first rapper
         rapper2_name: Name of the second rapper
@@ -117,6 +135,7 @@ async def execute_battle_round_parallel(
     """
 
     initial_state = {
+        "battle_id": battle_id,
         "round_id": round_id,
         "rapper1_name": rapper1_name,
         "rapper2_name": rapper2_name,
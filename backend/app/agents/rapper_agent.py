@@ -2,7 +2,7 @@
 Rapper agent implementation using LangGraph.
 """
 
-from typing import Annotated, Dict, List, Optional, TypedDict
+from typing import Annotated, List, Optional, TypedDict
 
 from langchain_core.messages import AnyMessage, HumanMessage, SystemMessage
 from langchain_mcp_adapters.client import MultiServerMCPClient
@@ -11,7 +11,9 @@ from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph, add_messages
 from langgraph.prebuilt import ToolNode, tools_condition
 
+from app.agents import get_llm_call_limiter
 from app.core.config import settings
+from app.models.verse import PreviousVerse
 from app.services.prompt_service import prompt_service
 from app.tools.artist_retrieval_tool import artist_retrieval_tool
 
@@ -38,6 +40,8 @@ class RapperAgent:
             temperature=0.9,
             api_key=settings.openai_api_key,
             streaming=False,
+            max_retries=settings.llm_max_retries,
+            timeout=settings.llm_timeout_seconds,
         )
 
         self.memory = MemorySaver()
@@ -114,10 +118,11 @@ class RapperAgent:
             StateGraph: The created graph
         """
 
-        def rapper_node(state: RapperState):
+        async def rapper_node(state: RapperState):
             """Process the state and generate a response."""
 
-            response = self.llm_with_tools.invoke(state["messages"])
+            async with get_llm_call_limiter():
+                response = await self.llm_with_tools.ainvoke(state["messages"])
 
             return {"messages": [response]}
 
@@ -140,7 +145,13 @@ class RapperAgent:
 
         return graph_builder.compile(checkpointer=self.memory)
 
-    def _get_thread_id(self, rapper_name: str, opponent_name: str, style: str) -> str:
+    def _get_thread_id(
+        self,
+        rapper_name: str,
+        opponent_name: str,
+        style: str,
+        battle_id: Optional[str] = None,
+    ) -> str:
         """
         Generate a consistent thread ID for conversation memory.
 
@@ -148,6 +159,8 @@ class RapperAgent:
             rapper_name: Name of the rapper
             opponent_name: Name of the opponent
             style: Rap style
+            battle_id: ID of the battle, so concurrent battles between the
+                same rappers do not share a conversation
 
         Returns:
             str: Thread ID for memory storage
@@ -156,7 +169,8 @@ class RapperAgent:
         battle_context = (
             f"{rapper_name.lower()}_{opponent_name.lower()}_{style.lower()}"
         )
-        return f"battle_{hash(battle_context) % 1000000}"
+        thread_id = f"battle_{hash(battle_context) % 1000000}"
+        return f"{thread_id}_{battle_id}" if battle_id else thread_id
 
     def _get_available_tools_info(self) -> str:
         """
@@ -197,7 +211,8 @@ class RapperAgent:
         opponent_name: str,
         style: str,
         round_number: int,
-        previous_verses: Optional[List[Dict]] = None,
+        previous_verses: Optional[List[PreviousVerse]] = None,
+        battle_id: Optional[str] = None,
     ) -> str:
         """
         Generate a rap verse using available tools for artist data retrieval.
@@ -208,6 +223,7 @@ class RapperAgent:
             style: Rap style
             round_number: Current round number
             previous_verses: Previous verses in the battle
+            battle_id: ID of the battle the verse is for
 
         Returns:
             str: Generated verse
@@ -220,7 +236,9 @@ class RapperAgent:
 
             is_first_round = round_number == 1
 
-            thread_id = self._get_thread_id(rapper_name, opponent_name, style)
+            thread_id = self._get_thread_id(
+                rapper_name, opponent_name, style, battle_id
+            )
             config = {"configurable": {"thread_id": thread_id}}
 
             system_message = self._create_system_message(
@@ -265,7 +283,7 @@ class RapperAgent:
         opponent_name: str,
         style: str,
         round_number: int,
-        previous_verses: Optional[List[Dict]] = None,
+        previous_verses: Optional[List[PreviousVerse]] = None,
         available_tools: Optional[str] = None,
     ) -> SystemMessage:
         """
@@ -4,6 +4,8 @@ Health check endpoints for the RAGERaps API.
 These endpoints allow monitoring the health and status of the API.
 """
 
+from typing import Dict
+
 from fastapi import APIRouter, status
 
 router = APIRouter(prefix="/health", tags=["health"])
@@ -21,7 +23,7 @@ router = APIRouter(prefix="/health", tags=["health"])
         }
     },
 )
-async def health_check():
+async def health_check() -> Dict[str, str]:
     """
     Check if the API is healthy and operational.
 
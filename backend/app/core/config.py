@@ -21,6 +21,13 @@ class Settings(BaseSettings):
     qdrant_api_key: Optional[str] = None
     qdrant_collection_name: str = "rap_styles"
     qdrant_artists_collection_name: str = "artists_lyrics"
+    embedding_max_concurrency: int = 8
+
+    llm_max_retries: int = 3
+    llm_max_concurrency: int = 16
+    llm_timeout_seconds: float = 60.0
+    prefetch_next_round: bool = False
+    prefetch_ttl_seconds: float = 600.0
 
     debug: bool = False
     environment: str = "development"
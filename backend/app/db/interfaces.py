@@ -34,6 +34,11 @@ class IBattleRepository(ABC):
         """Update an existing battle."""
         pass
 
+    @abstractmethod
+    def set_battle_winner(self, battle_id: UUID, winner: str) -> Optional[BattleDB]:
+        """Set the winner of a battle and mark it completed."""
+        pass
+
     @abstractmethod
     def add_round_to_battle(self, battle_id: UUID, round_obj: Round) -> Round:
         """Add a round to a battle."""
@@ -2,6 +2,7 @@
 Repository for battles stored in memory.
 """
 
+import sys
 from typing import Dict, List, Optional
 from uuid import UUID
 
@@ -22,15 +23,19 @@ class InMemoryBattleRepository(IBattleRepository):
         """
         Create a new battle.
 
+        The input has already been validated as BattleCreate, so the stored
+        model is built without re-running field validation. Rapper names are
+        interned so later winner comparisons can short-circuit on identity.
+
         Args:
             battle_data: Battle creation data
 
         Returns:
             BattleDB: Created battle
         """
-        battle = BattleDB(
-            rapper1_name=battle_data.rapper1_name,
-            rapper2_name=battle_data.rapper2_name,
+        battle = BattleDB.model_construct(
+            rapper1_name=sys.intern(battle_data.rapper1_name),
+            rapper2_name=sys.intern(battle_data.rapper2_name),
             style1=battle_data.style1,
             style2=battle_data.style2,
         )
@@ -72,10 +77,29 @@ class InMemoryBattleRepository(IBattleRepository):
         Raises:
             ValueError: If battle does not exist
         """
-        if battle.id not in self.battles:
+        stored_battle = self.battles.get(battle.id)
+        if stored_battle is None:
             raise ValueError(f"Battle with ID {battle.id} does not exist")
 
-        self.battles[battle.id] = battle
+        if stored_battle is not battle:
+            self.battles[battle.id] = battle
+        return battle
+
+    def set_battle_winner(self, battle_id: UUID, winner: str) -> Optional[BattleDB]:
+        """
+        Set the winner of a battle and mark it completed.
+
+        Args:
+            battle_id: ID of the battle
+            winner: Name of the winning rapper
+
+        Returns:
+            Optional[BattleDB]: Updated battle if found, None otherwise
+        """
+        battle = self.battles.get(battle_id)
+        if battle:
+            battle.winner = winner
+            battle.status = "completed"
         return battle
 
     def add_round_to_battle(self, battle_id: UUID, round_obj: Round) -> Round:
@@ -96,7 +120,7 @@ class InMemoryBattleRepository(IBattleRepository):
         if not battle:
             raise ValueError(f"Battle with ID {battle_id} does not exist")
 
-        battle.rounds.append(round_obj)
+        battle.add_round(round_obj)
         battle.current_round = round_obj.round_number
         return round_obj
 
@@ -126,16 +150,16 @@ class InMemoryBattleRepository(IBattleRepository):
         if not battle:
             raise ValueError(f"Battle with ID {battle_id} does not exist")
 
-        for battle_round in battle.rounds:
-            if battle_round.id == round_id:
-                battle_round.rapper1_verse = rapper1_verse
-                battle_round.rapper2_verse = rapper2_verse
+        battle_round = battle.get_round(round_id)
+        if battle_round is None:
+            raise ValueError(
+                f"Round with ID {round_id} does not exist in battle {battle_id}"
+            )
 
-                return battle_round
+        battle_round.rapper1_verse = rapper1_verse
+        battle_round.rapper2_verse = rapper2_verse
 
-        raise ValueError(
-            f"Round with ID {round_id} does not exist in battle {battle_id}"
-        )
+        return battle_round
 
 
 battle_repository = InMemoryBattleRepository()
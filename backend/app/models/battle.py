@@ -2,12 +2,13 @@
 Battle model definitions.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from app.models.round import Round
+from app.utils.common import describe_fields
 
 
 class BattleBase(BaseModel):
@@ -53,18 +54,30 @@ class BattleDB(BattleBase):
     including generated fields like ID and timestamps.
     """
 
+    model_config = ConfigDict(
+        json_schema_extra=describe_fields(
+            {
+                "rapper1_name": {"description": "Name of the first rapper"},
+                "rapper2_name": {"description": "Name of the second rapper"},
+                "status": {
+                    "description": "Battle status - can be 'in_progress' or 'completed'",
+                    "examples": ["in_progress", "completed"],
+                },
+                "winner": {
+                    "description": "Winner of the battle - set when a rapper wins 2 rounds or after all 3 rounds are completed",
+                },
+            }
+        )
+    )
+
     id: UUID = Field(default_factory=uuid4, description="Unique battle ID")
-    rapper1_name: str = Field(..., description="Name of the first rapper")
-    rapper2_name: str = Field(..., description="Name of the second rapper")
+    rapper1_name: str
+    rapper2_name: str
     rounds: List[Round] = Field(
         default_factory=list,
         description="Battle rounds - contains all rounds in the battle",
     )
-    status: str = Field(
-        default="in_progress",
-        description="Battle status - can be 'in_progress' or 'completed'",
-        examples=["in_progress", "completed"],
-    )
+    status: Literal["in_progress", "completed"] = "in_progress"
     current_round: int = Field(
         default=1,
         description="Current round number - starts at 1 and goes up to 3",
@@ -77,10 +90,86 @@ class BattleDB(BattleBase):
     rapper2_wins: int = Field(
         default=0, description="Number of rounds won by the second rapper", ge=0, le=3
     )
-    winner: Optional[str] = Field(
-        default=None,
-        description="Winner of the battle - set when a rapper wins 2 rounds or after all 3 rounds are completed",
-    )
+    winner: Optional[str] = None
+
+    _rounds_index: Dict[UUID, Round] = PrivateAttr(default_factory=dict)
+    _completed_rounds: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Index the initial rounds by ID and count the completed ones."""
+        self._rounds_index = {round_obj.id: round_obj for round_obj in self.rounds}
+        self._completed_rounds = sum(
+            1 for round_obj in self.rounds if round_obj.status == "completed"
+        )
+
+    @property
+    def completed_rounds(self) -> int:
+        """Number of rounds that have been judged."""
+        return self._completed_rounds
+
+    def get_round(self, round_id: UUID) -> Optional[Round]:
+        """
+        Get a round of this battle by ID.
+
+        Args:
+            round_id: ID of the round
+
+        Returns:
+            Optional[Round]: Round if found, None otherwise
+        """
+        return self._rounds_index.get(round_id)
+
+    def get_round_by_number(self, round_number: int) -> Optional[Round]:
+        """
+        Get a round of this battle by its number.
+
+        Args:
+            round_number: Number of the round (1-3)
+
+        Returns:
+            Optional[Round]: Round if found, None otherwise
+        """
+        return next(
+            (
+                round_obj
+                for round_obj in self.rounds
+                if round_obj.round_number == round_number
+            ),
+            None,
+        )
+
+    def add_round(self, round_obj: Round) -> None:
+        """
+        Append a round to the battle and index it by ID.
+
+        Args:
+            round_obj: Round to add
+        """
+        self.rounds.append(round_obj)
+        self._rounds_index[round_obj.id] = round_obj
+        if round_obj.status == "completed":
+            self._completed_rounds += 1
+
+    def record_round_winner(self, round_obj: Round, winner: str) -> None:
+        """
+        Mark a round as completed and credit the win to its rapper.
+
+        Args:
+            round_obj: Judged round of this battle
+            winner: Name of the rapper who won the round
+        """
+        if round_obj.status != "completed":
+            self._completed_rounds += 1
+
+        round_obj.winner = winner
+        round_obj.status = "completed"
+
+        # rapper1 is inserted last so it wins if both rappers share a name
+        wins_attr = {
+            self.rapper2_name: "rapper2_wins",
+            self.rapper1_name: "rapper1_wins",
+        }.get(winner, "rapper2_wins")
+        setattr(self, wins_attr, getattr(self, wins_attr) + 1)
 
 
 class BattleResponse(BattleDB):
@@ -90,3 +179,5 @@ class BattleResponse(BattleDB):
     This model is used when returning battle data to the client.
     It includes all fields from BattleDB and is configured to work with ORM models.
     """
+
+    model_config = ConfigDict(from_attributes=True)
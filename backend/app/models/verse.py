@@ -2,9 +2,12 @@
 Verse model definitions.
 """
 
-from uuid import UUID, uuid4
+from typing import NamedTuple
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.utils.common import describe_fields, pooled_uuid4
 
 
 class Verse(BaseModel):
@@ -14,22 +17,37 @@ class Verse(BaseModel):
     Represents a verse generated by a rapper in a battle round.
     """
 
-    id: UUID = Field(
-        default_factory=uuid4, description="Unique verse ID - automatically generated"
-    )
-    round_id: UUID = Field(
-        ...,
-        description="ID of the round this verse belongs to - must be a valid UUID of an existing round",
-    )
-    rapper_name: str = Field(
-        ...,
-        description="Name of the rapper who created this verse",
-        examples=["Kendrick Lamar", "Drake"],
-    )
-    content: str = Field(
-        ...,
-        description="Verse content - the actual rap lyrics",
-        examples=[
-            "I flow like water, you're just a drought\nMy rhymes hit harder, no doubt\nWhile you're stuck in the past, I innovate\nYour tired flow is something I can't tolerate"
-        ],
+    # Verses never change once generated; freezing them also makes them hashable
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra=describe_fields(
+            {
+                "id": {"description": "Unique verse ID - automatically generated"},
+                "round_id": {
+                    "description": "ID of the round this verse belongs to - must be a valid UUID of an existing round",
+                },
+                "rapper_name": {
+                    "description": "Name of the rapper who created this verse",
+                    "examples": ["Kendrick Lamar", "Drake"],
+                },
+                "content": {
+                    "description": "Verse content - the actual rap lyrics",
+                    "examples": [
+                        "I flow like water, you're just a drought\nMy rhymes hit harder, no doubt\nWhile you're stuck in the past, I innovate\nYour tired flow is something I can't tolerate"
+                    ],
+                },
+            }
+        ),
     )
+
+    id: UUID = Field(default_factory=pooled_uuid4)
+    round_id: UUID
+    rapper_name: str
+    content: str
+
+
+class PreviousVerse(NamedTuple):
+    """A verse from an earlier round, passed to the rapper agents as context."""
+
+    rapper_name: str
+    content: str
@@ -8,6 +8,7 @@ from uuid import UUID
 
 from app.db.repositories.battle_repo import battle_repository
 from app.models.battle import BattleCreate, BattleResponse
+from app.utils.common import log_errors
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,7 @@ class BattleCrudService:
     def __init__(self):
         self.repository = battle_repository
 
+    @log_errors(logger, "Failed to create battle")
     def create_battle(self, battle_data: BattleCreate) -> BattleResponse:
         """
         Create a new battle.
@@ -31,19 +33,18 @@ class BattleCrudService:
         Raises:
             Exception: If battle creation fails
         """
-        try:
-            logger.info(
-                f"Creating battle between {battle_data.rapper1_name} and {battle_data.rapper2_name}"
-            )
+        logger.info(
+            "Creating battle between %s and %s",
+            battle_data.rapper1_name,
+            battle_data.rapper2_name,
+        )
 
-            battle = self.repository.create_battle(battle_data)
-            logger.info(f"Successfully created battle with ID: {battle.id}")
+        battle = self.repository.create_battle(battle_data)
+        logger.info("Successfully created battle with ID: %s", battle.id)
 
-            return battle
-        except Exception as e:
-            logger.error(f"Failed to create battle: {str(e)}")
-            raise
+        return battle
 
+    @log_errors(logger, "Failed to get battle {battle_id}")
     def get_battle(self, battle_id: UUID) -> Optional[BattleResponse]:
         """
         Get a battle by ID.
@@ -54,15 +55,12 @@ class BattleCrudService:
         Returns:
             Optional[BattleResponse]: Battle if found, None otherwise
         """
-        try:
-            battle = self.repository.get_battle(battle_id)
-            if not battle:
-                logger.warning(f"Battle not found: {battle_id}")
-            return battle
-        except Exception as e:
-            logger.error(f"Failed to get battle {battle_id}: {str(e)}")
-            raise
+        battle = self.repository.get_battle(battle_id)
+        if not battle:
+            logger.warning("Battle not found: %s", battle_id)
+        return battle
 
+    @log_errors(logger, "Failed to list battles")
     def list_battles(self) -> List[BattleResponse]:
         """
         List all battles.
@@ -70,14 +68,11 @@ class BattleCrudService:
         Returns:
             List[BattleResponse]: List of all battles
         """
-        try:
-            battles = self.repository.list_battles()
-            logger.info(f"Retrieved {len(battles)} battles")
-            return battles
-        except Exception as e:
-            logger.error(f"Failed to list battles: {str(e)}")
-            raise
+        battles = self.repository.list_battles()
+        logger.info("Retrieved %s battles", len(battles))
+        return battles
 
+    @log_errors(logger, "Failed to update battle {battle_id} winner")
     def update_battle_winner(
         self, battle_id: UUID, winner: str
     ) -> Optional[BattleResponse]:
@@ -91,21 +86,14 @@ class BattleCrudService:
         Returns:
             Optional[BattleResponse]: Updated battle if successful, None otherwise
         """
-        try:
-            battle = self.repository.get_battle(battle_id)
-            if not battle:
-                logger.warning(f"Battle not found for winner update: {battle_id}")
-                return None
-
-            battle.winner = winner
-            battle.status = "completed"
-            updated_battle = self.repository.update_battle(battle)
-            logger.info(f"Set battle {battle_id} winner to {winner}")
-
-            return updated_battle
-        except Exception as e:
-            logger.error(f"Failed to update battle {battle_id} winner: {str(e)}")
-            raise
+        battle = self.repository.set_battle_winner(battle_id, winner)
+        if not battle:
+            logger.warning("Battle not found for winner update: %s", battle_id)
+            return None
+
+        logger.info("Set battle %s winner to %s", battle_id, winner)
+
+        return battle
 
 
 battle_crud_service = BattleCrudService()
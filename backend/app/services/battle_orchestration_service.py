@@ -2,16 +2,21 @@
 Service for orchestrating complex battle workflows.
 """
 
+import asyncio
 import logging
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 from uuid import UUID
 
+from app.core.config import settings
 from app.models.battle import BattleCreate, BattleResponse
 from app.models.judgment import JudgmentCreate
+from app.models.round import Round
 from app.services.battle_crud_service import battle_crud_service
 from app.services.judgment_service import judgment_service
 from app.services.round_management_service import round_management_service
 from app.services.verse_generation_service import verse_generation_service
+from app.utils.common import log_errors
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +29,9 @@ class BattleOrchestrationService:
         self.verse_service = verse_generation_service
         self.round_service = round_management_service
         self.judgment_service = judgment_service
+        self._prefetched_rounds: Dict[UUID, Tuple[Round, asyncio.Task, float]] = {}
 
+    @log_errors(logger, "Failed to generate complete battle")
     async def generate_complete_battle(
         self, battle_data: BattleCreate
     ) -> BattleResponse:
@@ -40,32 +47,28 @@ class BattleOrchestrationService:
         Raises:
             Exception: If battle generation fails
         """
-        try:
-            logger.info(
-                f"Starting complete battle generation: {battle_data.rapper1_name} vs {battle_data.rapper2_name}"
-            )
+        logger.info(
+            "Starting complete battle generation: %s vs %s",
+            battle_data.rapper1_name,
+            battle_data.rapper2_name,
+        )
 
-            battle = self.crud_service.create_battle(battle_data)
+        battle = self.crud_service.create_battle(battle_data)
 
-            for round_number in range(1, 4):
-                await self._generate_battle_round(battle, round_number)
+        for round_number in range(1, 4):
+            await self._generate_battle_round(battle, round_number)
 
-                if self.round_service.is_battle_complete(battle):
-                    break
-
-            battle_winner = self.judgment_service.determine_battle_winner(battle)
-            if battle_winner:
-                battle = self.crud_service.update_battle_winner(
-                    battle.id, battle_winner
-                )
+            if self.round_service.is_battle_complete(battle):
+                break
 
-            logger.info(f"Complete battle generated successfully: {battle.id}")
-            return battle
+        battle_winner = self.judgment_service.determine_battle_winner(battle)
+        if battle_winner:
+            battle = self.crud_service.update_battle_winner(battle.id, battle_winner)
 
-        except Exception as e:
-            logger.error(f"Failed to generate complete battle: {str(e)}")
-            raise
+        logger.info("Complete battle generated successfully: %s", battle.id)
+        return battle
 
+    @log_errors(logger, "Failed to generate battle with verses")
     async def generate_battle_with_verses(
         self, battle_data: BattleCreate
     ) -> BattleResponse:
@@ -81,22 +84,21 @@ class BattleOrchestrationService:
         Raises:
             Exception: If battle generation fails
         """
-        try:
-            logger.info(
-                f"Generating battle with first round verses: {battle_data.rapper1_name} vs {battle_data.rapper2_name}"
-            )
+        logger.info(
+            "Generating battle with first round verses: %s vs %s",
+            battle_data.rapper1_name,
+            battle_data.rapper2_name,
+        )
 
-            battle = self.crud_service.create_battle(battle_data)
+        battle = self.crud_service.create_battle(battle_data)
 
-            await self._generate_battle_round(battle, 1)
+        await self._generate_battle_round(battle, 1)
+        self._prefetch_next_round(battle)
 
-            logger.info(f"Battle with first round generated successfully: {battle.id}")
-            return battle
-
-        except Exception as e:
-            logger.error(f"Failed to generate battle with verses: {str(e)}")
-            raise
+        logger.info("Battle with first round generated successfully: %s", battle.id)
+        return battle
 
+    @log_errors(logger, "Failed to continue battle {battle_id}")
     async def continue_battle_to_next_round(
         self, battle_id: UUID
     ) -> Optional[BattleResponse]:
@@ -112,36 +114,33 @@ class BattleOrchestrationService:
         Raises:
             Exception: If continuation fails
         """
-        try:
-            battle = self.crud_service.get_battle(battle_id)
-            if not battle:
-                raise ValueError(f"Battle not found: {battle_id}")
+        battle = self.crud_service.get_battle(battle_id)
+        if not battle:
+            raise ValueError(f"Battle not found: {battle_id}")
 
-            if self.round_service.is_battle_complete(battle):
-                logger.info(f"Battle {battle_id} is already complete")
-                return battle
-
-            next_round = battle.current_round + 1
-            if next_round > 3:
-                logger.info(f"Battle {battle_id} has reached maximum rounds")
-                return battle
+        if self.round_service.is_battle_complete(battle):
+            logger.info("Battle %s is already complete", battle_id)
+            return battle
 
-            await self._generate_battle_round(battle, next_round)
+        next_round = battle.current_round + 1
+        if next_round > 3:
+            logger.info("Battle %s has reached maximum rounds", battle_id)
+            return battle
 
-            if self.round_service.is_battle_complete(battle):
-                battle_winner = self.judgment_service.determine_battle_winner(battle)
-                if battle_winner:
-                    battle = self.crud_service.update_battle_winner(
-                        battle.id, battle_winner
-                    )
+        await self._generate_battle_round(battle, next_round)
+        self._prefetch_next_round(battle)
 
-            logger.info(f"Battle {battle_id} continued to round {next_round}")
-            return battle
+        if self.round_service.is_battle_complete(battle):
+            battle_winner = self.judgment_service.determine_battle_winner(battle)
+            if battle_winner:
+                battle = self.crud_service.update_battle_winner(
+                    battle.id, battle_winner
+                )
 
-        except Exception as e:
-            logger.error(f"Failed to continue battle {battle_id}: {str(e)}")
-            raise
+        logger.info("Battle %s continued to round %s", battle_id, next_round)
+        return battle
 
+    @log_errors(logger, "Failed to judge round {round_id}")
     async def judge_round(
         self,
         battle_id: UUID,
@@ -162,32 +161,45 @@ class BattleOrchestrationService:
         Raises:
             Exception: If judging fails
         """
-        try:
-            logger.info(f"Judging round {round_id} in battle {battle_id}")
+        logger.info("Judging round %s in battle %s", round_id, battle_id)
+
+        use_ai = user_judgment is None
 
-            use_ai = user_judgment is None
-            battle = await self.judgment_service.judge_round_and_update_battle(
-                battle_id, round_id, use_ai, user_judgment
+        # If this judgment cannot finish the battle, the next round will be
+        # needed anyway, so it is generated while this one is being judged.
+        battle = self.crud_service.get_battle(battle_id)
+        if battle and self._is_next_round_certain(battle):
+            next_round = asyncio.ensure_future(
+                self.continue_battle_to_next_round(battle_id)
             )
+            try:
+                await self.judgment_service.judge_round_and_update_battle(
+                    battle_id, round_id, use_ai, user_judgment
+                )
+            except Exception:
+                next_round.cancel()
+                raise
 
-            if not battle:
-                return None
+            battle = await next_round
+            logger.info("Round %s judged successfully", round_id)
+            return battle
 
-            if (
-                not self.round_service.is_battle_complete(battle)
-                and len(battle.rounds) < 3
-            ):
-                await self.continue_battle_to_next_round(battle_id)
+        battle = await self.judgment_service.judge_round_and_update_battle(
+            battle_id, round_id, use_ai, user_judgment
+        )
 
-                battle = self.crud_service.get_battle(battle_id)
+        if not battle:
+            return None
 
-            logger.info(f"Round {round_id} judged successfully")
-            return battle
+        if self.round_service.is_battle_complete(battle):
+            self._discard_prefetched_round(battle_id)
+        elif len(battle.rounds) < 3:
+            battle = await self.continue_battle_to_next_round(battle_id)
 
-        except Exception as e:
-            logger.error(f"Failed to judge round {round_id}: {str(e)}")
-            raise
+        logger.info("Round %s judged successfully", round_id)
+        return battle
 
+    @log_errors(logger, "Failed to generate round {round_number}")
     async def _generate_battle_round(
         self,
         battle: BattleResponse,
@@ -196,6 +208,11 @@ class BattleOrchestrationService:
         """
         Generate a complete battle round with verses.
 
+        Does nothing if the battle already has a round with this number. The
+        round is only added to the battle once both verses exist, so a failed
+        generation leaves nothing behind and can be retried, and concurrent
+        continuations cannot add the same round twice.
+
         Args:
             battle: Battle object
             round_number: Round number to generate
@@ -203,10 +220,24 @@ class BattleOrchestrationService:
         Raises:
             Exception: If round generation fails
         """
-        try:
-            logger.info(f"Generating round {round_number} for battle {battle.id}")
+        if battle.get_round_by_number(round_number):
+            logger.info(
+                "Round %s already exists for battle %s", round_number, battle.id
+            )
+            return
+
+        logger.info("Generating round %s for battle %s", round_number, battle.id)
 
-            round_obj = self.round_service.create_round(battle.id, round_number)
+        prefetched = self._prefetched_rounds.pop(battle.id, None)
+        if prefetched and prefetched[0].round_number == round_number:
+            round_obj, verses_task, _ = prefetched
+
+            rapper1_verse, rapper2_verse = await verses_task
+        else:
+            if prefetched:
+                prefetched[1].cancel()
+
+            round_obj = self.round_service.build_round(battle.id, round_number)
 
             previous_verses = self.round_service.get_previous_verses(
                 battle, round_number
@@ -219,20 +250,105 @@ class BattleOrchestrationService:
                 battle, round_obj, previous_verses
             )
 
-            if not rapper1_verse or not rapper2_verse:
-                raise Exception(f"Failed to generate verses for round {round_number}")
+        if not rapper1_verse or not rapper2_verse:
+            raise Exception(f"Failed to generate verses for round {round_number}")
 
-            self.round_service.add_verses_to_round(
-                battle.id, round_obj.id, rapper1_verse, rapper2_verse
+        if battle.get_round_by_number(round_number):
+            logger.info(
+                "Round %s was generated concurrently for battle %s",
+                round_number,
+                battle.id,
             )
+            return
+
+        self.round_service.add_round(battle.id, round_obj)
+        self.round_service.add_verses_to_round(
+            battle.id, round_obj.id, rapper1_verse, rapper2_verse
+        )
 
-            battle.current_round = round_number
+        battle.current_round = round_number
 
-            logger.info(f"Successfully generated round {round_number}")
+        logger.info("Successfully generated round %s", round_number)
 
-        except Exception as e:
-            logger.error(f"Failed to generate round {round_number}: {str(e)}")
-            raise
+    def _prefetch_next_round(self, battle: BattleResponse) -> None:
+        """
+        Start generating the next round's verses before that round is requested.
+
+        Verses do not depend on who won earlier rounds, only on their verses,
+        so they can be generated while the current round waits for judgment.
+        The round is only added to the battle once it is actually requested.
+
+        Rounds that are certain to be played are already generated alongside
+        the judgment in judge_round. This only covers rounds the pending
+        judgments may make unnecessary, so it is speculative and does nothing
+        unless the prefetch_next_round setting is enabled.
+
+        Args:
+            battle: Battle whose latest round has its verses
+        """
+        if not settings.prefetch_next_round:
+            return
+
+        self._evict_stale_prefetched_rounds()
+        self._discard_prefetched_round(battle.id)
+
+        round_number = battle.current_round + 1
+        if (
+            round_number > 3
+            or self.round_service.is_battle_complete(battle)
+            or self._is_next_round_certain(battle)
+        ):
+            return
+
+        round_obj = self.round_service.build_round(battle.id, round_number)
+        previous_verses = self.round_service.get_previous_verses(battle, round_number)
+        verses_task = asyncio.ensure_future(
+            self.verse_service.generate_verses_for_round(
+                battle, round_obj, previous_verses
+            )
+        )
+        self._prefetched_rounds[battle.id] = (
+            round_obj,
+            verses_task,
+            time.monotonic(),
+        )
+        logger.info("Prefetching round %s for battle %s", round_number, battle.id)
+
+    def _is_next_round_certain(self, battle: BattleResponse) -> bool:
+        """
+        Check whether another round is needed however pending rounds are judged.
+
+        Args:
+            battle: Battle object
+
+        Returns:
+            bool: True if no rapper can reach two wins before the next round
+        """
+        pending_rounds = len(battle.rounds) - battle.completed_rounds
+        leading_wins = max(battle.rapper1_wins, battle.rapper2_wins)
+        return len(battle.rounds) < 3 and leading_wins + pending_rounds < 2
+
+    def _discard_prefetched_round(self, battle_id: UUID) -> None:
+        """
+        Cancel any verse generation prefetched for a battle.
+
+        Args:
+            battle_id: UUID of the battle
+        """
+        prefetched = self._prefetched_rounds.pop(battle_id, None)
+        if prefetched:
+            prefetched[1].cancel()
+
+    def _evict_stale_prefetched_rounds(self) -> None:
+        """Cancel prefetched rounds that were not requested within the TTL."""
+        cutoff = time.monotonic() - settings.prefetch_ttl_seconds
+        stale_battle_ids = [
+            battle_id
+            for battle_id, (_, _, created_at) in self._prefetched_rounds.items()
+            if created_at < cutoff
+        ]
+        for battle_id in stale_battle_ids:
+            self._discard_prefetched_round(battle_id)
 
 
 battle_orchestration_service = BattleOrchestrationService()
@@ -4,6 +4,8 @@ Service for judging rap battle rounds.
 
 import logging
 import random
+import sys
+import time
 from typing import Optional, Tuple
 from uuid import UUID
 
@@ -37,12 +39,15 @@ class JudgmentService:
         """
         try:
             logger.info(
-                f"AI judging round {current_round.round_number} of battle {battle.id}"
+                "AI judging round %s of battle %s",
+                current_round.round_number,
+                battle.id,
             )
 
             if not current_round.rapper1_verse or not current_round.rapper2_verse:
                 raise ValueError("Cannot judge round without both verses")
 
+            started = time.perf_counter()
             winner, feedback = await judge_agent.judge_round(
                 rapper1_name=battle.rapper1_name,
                 rapper1_verse=current_round.rapper1_verse.content,
@@ -51,19 +56,24 @@ class JudgmentService:
                 rapper2_verse=current_round.rapper2_verse.content,
                 rapper2_style=battle.style2,
             )
+            logger.info(
+                "Judge call for round %s took %.1f ms",
+                current_round.round_number,
+                (time.perf_counter() - started) * 1000,
+            )
 
             if winner not in [battle.rapper1_name, battle.rapper2_name]:
-                logger.warning(f"Invalid winner from AI: {winner}, using fallback")
+                logger.warning("Invalid winner from AI: %s, using fallback", winner)
                 return self._fallback_judgment(battle)
 
             logger.info(
-                f"AI judged round {current_round.round_number}: winner is {winner}"
+                "AI judged round %s: winner is %s", current_round.round_number, winner
             )
             return winner, feedback
 
         except Exception as e:
             logger.error(
-                f"AI judging failed for round {current_round.round_number}: {str(e)}"
+                "AI judging failed for round %s: %s", current_round.round_number, e
             )
             return self._fallback_judgment(battle)
 
@@ -112,12 +122,7 @@ class JudgmentService:
             if not battle:
                 raise ValueError(f"Battle not found: {battle_id}")
 
-            target_round = None
-            for round_obj in battle.rounds:
-                if round_obj.id == round_id:
-                    target_round = round_obj
-                    break
-
+            target_round = battle.get_round(round_id)
             if not target_round:
                 raise ValueError(f"Round not found: {round_id}")
 
@@ -135,13 +140,8 @@ class JudgmentService:
                 if hasattr(user_judgment, "feedback") and user_judgment.feedback:
                     target_round.feedback = user_judgment.feedback
 
-            target_round.winner = winner
-            target_round.status = "completed"
-
-            if winner == battle.rapper1_name:
-                battle.rapper1_wins += 1
-            else:
-                battle.rapper2_wins += 1
+            winner = sys.intern(winner)
+            battle.record_round_winner(target_round, winner)
 
             battle_winner = self.determine_battle_winner(battle)
             if battle_winner:
@@ -149,12 +149,12 @@ class JudgmentService:
                 battle.status = "completed"
 
             updated_battle = self.repository.update_battle(battle)
-            logger.info(f"Round {round_id} judged successfully, winner: {winner}")
+            logger.info("Round %s judged successfully, winner: %s", round_id, winner)
 
             return updated_battle
 
         except Exception as e:
-            logger.error(f"Failed to judge round {round_id}: {str(e)}")
+            logger.error("Failed to judge round %s: %s", round_id, e)
             raise
 
     def determine_battle_winner(self, battle: BattleResponse) -> Optional[str]:
@@ -173,8 +173,7 @@ class JudgmentService:
         elif battle.rapper2_wins >= 2:
             return battle.rapper2_name
 
-        completed_rounds = sum(1 for r in battle.rounds if r.status == "completed")
-        if completed_rounds >= 3:
+        if battle.completed_rounds >= 3:
             if battle.rapper1_wins > battle.rapper2_wins:
                 return battle.rapper1_name
             elif battle.rapper2_wins > battle.rapper1_wins:
@@ -5,11 +5,13 @@ Centralized prompt management service for RAGERaps application.
 import tomllib
 
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from functools import lru_cache
 
 from pydantic import BaseModel, Field
 
+from app.models.verse import PreviousVerse
+
 
 class PromptTemplate(BaseModel):
     """Model for prompt templates with variable substitution."""
@@ -150,7 +152,7 @@ class PromptService:
         biographical_info: Optional[str] = None,
         opponent_biographical_info: Optional[str] = None,
         is_first_round: bool = False,
-        previous_verses: Optional[List[Dict]] = None,
+        previous_verses: Optional[List[PreviousVerse]] = None,
     ) -> str:
         """
         Get a complete system message for the rapper agent.
@@ -204,19 +206,9 @@ class PromptService:
                 "rapper", "system_message", "previous_verses_context"
             )
 
-            formatted_verses = []
-            for verse in previous_verses:
-                verse_format = self.get_prompt(
-                    "system", "formatting", "rapper_verse_format"
-                )
-                formatted_verses.append(
-                    verse_format.format(
-                        rapper_name=verse["rapper_name"], content=verse["content"]
-                    )
-                )
-
-            separator = self.get_prompt("system", "formatting", "verse_separator")
-            previous_verses_formatted = separator.template.join(formatted_verses)
+            previous_verses_formatted = self._format_previous_verses(
+                tuple(previous_verses)
+            )
 
             system_content += context_template.format(
                 previous_verses_formatted=previous_verses_formatted
@@ -224,6 +216,30 @@ class PromptService:
 
         return system_content
 
+    @lru_cache(maxsize=128)
+    def _format_previous_verses(
+        self, previous_verses: Tuple[PreviousVerse, ...]
+    ) -> str:
+        """
+        Format previous verses for the rapper system message.
+
+        Both rappers in a round share the same previous verses, so the
+        formatted text is cached by content.
+
+        Args:
+            previous_verses: Previous verses in battle order
+
+        Returns:
+            str: Previous verses joined with the verse separator
+        """
+        verse_format = self.get_prompt("system", "formatting", "rapper_verse_format")
+        separator = self.get_prompt("system", "formatting", "verse_separator")
+
+        return separator.template.join(
+            verse_format.format(rapper_name=rapper_name, content=content)
+            for rapper_name, content in previous_verses
+        )
+
     def get_judge_system_prompt(self) -> str:
         """
         Get the system prompt for the judge agent.
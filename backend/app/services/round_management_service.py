@@ -3,13 +3,13 @@ Service for managing rounds in rap battles.
 """
 
 import logging
-from typing import Dict, List
+from typing import List
 from uuid import UUID
 
 from app.db.repositories.battle_repo import battle_repository
 from app.models.battle import BattleResponse
 from app.models.round import Round
-from app.models.verse import Verse
+from app.models.verse import PreviousVerse, Verse
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +22,7 @@ class RoundManagementService:
 
     def get_previous_verses(
         self, battle: BattleResponse, round_number: int
-    ) -> List[Dict[str, str]]:
+    ) -> List[PreviousVerse]:
         """
         Get verses from previous rounds for context.
 
@@ -31,66 +31,53 @@ class RoundManagementService:
             round_number: Current round number
 
         Returns:
-            List[Dict[str, str]]: List of previous verses
+            List[PreviousVerse]: List of previous verses
         """
-        previous_verses = []
-
-        for round_obj in battle.rounds:
-            if round_obj.round_number < round_number:
-                if round_obj.rapper1_verse:
-                    previous_verses.append(
-                        {
-                            "rapper_name": battle.rapper1_name,
-                            "content": round_obj.rapper1_verse.content,
-                        }
-                    )
-                if round_obj.rapper2_verse:
-                    previous_verses.append(
-                        {
-                            "rapper_name": battle.rapper2_name,
-                            "content": round_obj.rapper2_verse.content,
-                        }
-                    )
-
-        return previous_verses
-
-    def create_round(self, battle_id: UUID, round_number: int) -> Round:
+        return [
+            PreviousVerse(rapper_name, verse.content)
+            for round_obj in battle.rounds
+            if round_obj.round_number < round_number
+            for rapper_name, verse in (
+                (battle.rapper1_name, round_obj.rapper1_verse),
+                (battle.rapper2_name, round_obj.rapper2_verse),
+            )
+            if verse
+        ]
+
+    def build_round(self, battle_id: UUID, round_number: int) -> Round:
         """
-        Create a new round for a battle.
+        Build a new round for a battle without adding it to the battle.
 
         Args:
             battle_id: UUID of the battle
             round_number: Number of the round (1-3)
 
         Returns:
-            Round: Created round object
+            Round: New round object
 
         Raises:
             ValueError: If round number is invalid
-            Exception: If round creation fails
         """
         if round_number < 1 or round_number > 3:
             raise ValueError(f"Invalid round number: {round_number}. Must be 1-3.")
 
-        try:
-            logger.info(f"Creating round {round_number} for battle {battle_id}")
+        return Round.model_construct(
+            battle_id=battle_id,
+            round_number=round_number,
+        )
 
-            round_obj = Round(
-                battle_id=battle_id,
-                round_number=round_number,
-            )
+    def add_round(self, battle_id: UUID, round_obj: Round) -> Round:
+        """
+        Add an already built round to a battle.
 
-            created_round = self.repository.add_round_to_battle(battle_id, round_obj)
-            logger.info(
-                f"Successfully created round {round_number} with ID: {created_round.id}"
-            )
+        Args:
+            battle_id: UUID of the battle
+            round_obj: Round to add
 
-            return created_round
-        except Exception as e:
-            logger.error(
-                f"Failed to create round {round_number} for battle {battle_id}: {str(e)}"
-            )
-            raise
+        Returns:
+            Round: Added round
+        """
+        return self.repository.add_round_to_battle(battle_id, round_obj)
 
     def add_verses_to_round(
         self,
@@ -115,16 +102,16 @@ class RoundManagementService:
             Exception: If adding verses fails
         """
         try:
-            logger.info(f"Adding verses to round {round_id}")
+            logger.info("Adding verses to round %s", round_id)
 
             updated_round = self.repository.add_verses_to_round(
                 battle_id, round_id, rapper1_verse, rapper2_verse
             )
 
-            logger.info(f"Successfully added verses to round {round_id}")
+            logger.info("Successfully added verses to round %s", round_id)
             return updated_round
         except Exception as e:
-            logger.error(f"Failed to add verses to round {round_id}: {str(e)}")
+            logger.error("Failed to add verses to round %s: %s", round_id, e)
             raise
 
     def is_battle_complete(self, battle: BattleResponse) -> bool:
@@ -141,8 +128,7 @@ class RoundManagementService:
         if battle.rapper1_wins >= 2 or battle.rapper2_wins >= 2:
             return True
 
-        completed_rounds = sum(1 for r in battle.rounds if r.status == "completed")
-        if completed_rounds >= 3:
+        if battle.completed_rounds >= 3:
             return True
 
         return False
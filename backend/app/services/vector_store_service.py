@@ -2,7 +2,11 @@
 Vector store service for managing artist data in Qdrant using LangChain.
 """
 
-from typing import List, Optional
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from langchain_core.documents import Document
 from langchain_openai import OpenAIEmbeddings
@@ -15,17 +19,31 @@ from qdrant_client.http.models import (
 
 from app.core.config import settings
 
+SEARCH_CACHE_MAX_SIZE = 1024
+SEARCH_CACHE_TTL_SECONDS = 600
+EMBEDDING_CACHE_MAX_SIZE = 4096
+
+
+@lru_cache(maxsize=1)
+def _get_embeddings() -> OpenAIEmbeddings:
+    """Get the shared OpenAI embeddings client, creating it on first use."""
+    return OpenAIEmbeddings(
+        model="text-embedding-3-small", api_key=settings.openai_api_key
+    )
+
 
 class VectorStoreService:
     """Service for managing vector store operations with artist data."""
 
     def __init__(self):
         """Initialize the vector store service."""
-        self.embeddings = OpenAIEmbeddings(
-            model="text-embedding-3-small", api_key=settings.openai_api_key
-        )
         self._client: Optional[QdrantClient] = None
         self._vector_store: Optional[QdrantVectorStore] = None
+        self._search_cache: Dict[Tuple[str, int], Tuple[float, List[Document]]] = {}
+        self._pending_searches: Dict[
+            Tuple[asyncio.AbstractEventLoop, str, int], asyncio.Future
+        ] = {}
+        self._query_embeddings: OrderedDict[str, List[float]] = OrderedDict()
 
     def get_client(self) -> QdrantClient:
         """
@@ -58,13 +76,22 @@ class VectorStoreService:
             self._vector_store = QdrantVectorStore(
                 client=client,
                 collection_name=settings.qdrant_artists_collection_name,
-                embedding=self.embeddings,
+                embedding=_get_embeddings(),
             )
 
         return self._vector_store
 
     async def _ensure_artists_collection_exists(self) -> None:
-        """Ensure the artists collection exists in Qdrant."""
+        """
+        Ensure the artists collection exists in Qdrant.
+
+        The Qdrant client is synchronous, so the check and setup calls run in
+        a worker thread instead of blocking the event loop.
+        """
+        await asyncio.to_thread(self._create_artists_collection_if_missing)
+
+    def _create_artists_collection_if_missing(self) -> None:
+        """Create the artists collection and its payload indexes if missing."""
         client = self.get_client()
         collection_name = settings.qdrant_artists_collection_name
 
@@ -105,28 +132,98 @@ class VectorStoreService:
         """
         Search for artists using semantic similarity.
 
+        Results are cached per (query, k) for SEARCH_CACHE_TTL_SECONDS, and
+        concurrent identical searches on the same event loop share a single
+        in-flight request. Each caller gets its own copy of the result list.
+
         Args:
             query: Search query
             k: Number of results to return
-            filter_dict: Optional metadata filters (e.g., {"artist": "Eminem"})
 
         Returns:
             List[Document]: Search results with lyrics in metadata
         """
+        key = (query, k)
+
+        cached = self._search_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return list(cached[1])
+
+        # Futures can only be awaited on the loop that created them, and the
+        # artist retrieval tool runs searches on its own loops when called
+        # synchronously, so in-flight searches are shared per loop.
+        pending_key = (asyncio.get_running_loop(), query, k)
+        pending = self._pending_searches.get(pending_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._search_artists_uncached(query, k))
+            self._pending_searches[pending_key] = pending
+            pending.add_done_callback(
+                lambda _: self._pending_searches.pop(pending_key, None)
+            )
+
+        return list(await asyncio.shield(pending))
+
+    async def _search_artists_uncached(self, query: str, k: int) -> List[Document]:
+        """
+        Run a similarity search against the vector store and cache the results.
+
+        Args:
+            query: Search query
+            k: Number of results to return
+
+        Returns:
+            List[Document]: Search results, or an empty list if the search failed
+        """
         vector_store = await self.get_vector_store()
 
         try:
-            results = await vector_store.asimilarity_search(query=query, k=k)
+            embedding = await self._embed_query(query)
+            results = await vector_store.asimilarity_search_by_vector(
+                embedding=embedding, k=k
+            )
         except Exception as e:
             print(f"Vector store search failed: {e}")
             return []
 
+        if len(self._search_cache) >= SEARCH_CACHE_MAX_SIZE:
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[(query, k)] = (
+            time.monotonic() + SEARCH_CACHE_TTL_SECONDS,
+            results,
+        )
+
         return results
 
+    async def _embed_query(self, query: str) -> List[float]:
+        """
+        Embed a search query, reusing the vector of a previously seen query.
+
+        Args:
+            query: Search query
+
+        Returns:
+            List[float]: Embedding vector for the query
+        """
+        embedding = self._query_embeddings.get(query)
+        if embedding is not None:
+            self._query_embeddings.move_to_end(query)
+            return embedding
+
+        embedding = await _get_embeddings().aembed_query(query)
+
+        self._query_embeddings[query] = embedding
+        if len(self._query_embeddings) > EMBEDDING_CACHE_MAX_SIZE:
+            self._query_embeddings.popitem(last=False)
+
+        return embedding
+
     async def add_artist_data_batch(self, artist_data_list) -> List[str]:
         """
         Add multiple artist data records to the vector store.
 
+        The whole batch is embedded with one embeddings request and written
+        with one upsert instead of the vector store's default chunks of 64.
+
         Args:
             artist_data_list: List of ArtistData objects
 
@@ -149,7 +246,12 @@ class VectorStoreService:
             document = Document(page_content=content, metadata=metadata)
             documents.append(document)
 
-        doc_ids = await vector_store.aadd_documents(documents)
+        if not documents:
+            return []
+
+        doc_ids = await vector_store.aadd_documents(
+            documents, batch_size=len(documents)
+        )
         return doc_ids
 
 
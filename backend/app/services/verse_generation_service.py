@@ -2,17 +2,33 @@
 Service for generating verses in rap battles.
 """
 
+import asyncio
 import logging
 import random
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import List, Optional, Tuple
 
 from app.agents.parallel_workflow import execute_battle_round_parallel
+from app.agents.rapper_agent import rapper_agent
 from app.models.battle import BattleResponse
 from app.models.round import Round
-from app.models.verse import Verse
+from app.models.verse import PreviousVerse, Verse
 
 logger = logging.getLogger(__name__)
 
+FAILED_VERSE_PREFIXES = ("Error generating verse", "Error extracting verse")
+
+FALLBACK_VERSE_LINES = (
+    "I'm the king of this game, no one can compete",
+    "My rhymes are so fire, they can't be beat",
+    "Step to me wrong and you'll face defeat",
+    "I'm on another level, my flow's so neat",
+    "Respect my name, I'm elite on the street",
+    "My words cut deep, my verses are sweet",
+    "You can't match my style, accept your defeat",
+    "I rise to the top, that's my main feat",
+)
+
 
 class VerseGenerationService:
     """Service responsible for generating verses for rap battles."""
@@ -21,7 +37,7 @@ class VerseGenerationService:
         self,
         battle: BattleResponse,
         round_obj: Round,
-        previous_verses: List[Dict[str, str]],
+        previous_verses: List[PreviousVerse],
     ) -> Tuple[Optional[Verse], Optional[Verse]]:
         """
         Generate verses for both rappers in a round using parallel execution.
@@ -36,10 +52,14 @@ class VerseGenerationService:
         """
         try:
             logger.info(
-                f"Generating verses for round {round_obj.round_number} in battle {battle.id}"
+                "Generating verses for round %s in battle %s",
+                round_obj.round_number,
+                battle.id,
             )
 
+            started = time.perf_counter()
             result = await execute_battle_round_parallel(
+                battle_id=str(battle.id),
                 round_id=round_obj.id,
                 rapper1_name=battle.rapper1_name,
                 rapper2_name=battle.rapper2_name,
@@ -48,42 +68,131 @@ class VerseGenerationService:
                 round_number=round_obj.round_number,
                 previous_verses=previous_verses,
             )
+            logger.info(
+                "Verse generation for round %s took %.1f ms",
+                round_obj.round_number,
+                (time.perf_counter() - started) * 1000,
+            )
+
+            # Keyed by side rather than name, so rappers with similar names
+            # cannot be mixed up
+            contents = {
+                verse["side"]: verse["content"] for verse in result.get("verses", [])
+            }
 
-            verses = result.get("verses", [])
-            rapper1_verse = None
-            rapper2_verse = None
-
-            for verse in verses:
-                if verse["rapper_name"] == battle.rapper1_name:
-                    rapper1_verse = Verse(
-                        round_id=round_obj.id,
-                        rapper_name=battle.rapper1_name,
-                        content=verse["content"],
-                    )
-                elif verse["rapper_name"] == battle.rapper2_name:
-                    rapper2_verse = Verse(
-                        round_id=round_obj.id,
-                        rapper_name=battle.rapper2_name,
-                        content=verse["content"],
-                    )
-
-            if not rapper1_verse or not rapper2_verse:
+            sides = (
+                ("rapper1", battle.rapper1_name, battle.rapper2_name, battle.style1),
+                ("rapper2", battle.rapper2_name, battle.rapper1_name, battle.style2),
+            )
+            failed_sides = [
+                side for side in sides if self._is_failed_verse(contents.get(side[0]))
+            ]
+            if failed_sides:
                 logger.warning(
-                    f"Failed to generate verses for round {round_obj.round_number}, using fallback"
+                    "Retrying %s failed verse(s) for round %s",
+                    len(failed_sides),
+                    round_obj.round_number,
+                )
+                retried_contents = await asyncio.gather(
+                    *(
+                        rapper_agent.generate_verse(
+                            rapper_name=rapper_name,
+                            opponent_name=opponent_name,
+                            style=style,
+                            round_number=round_obj.round_number,
+                            previous_verses=previous_verses,
+                            battle_id=str(battle.id),
+                        )
+                        for _, rapper_name, opponent_name, style in failed_sides
+                    ),
+                    return_exceptions=True,
                 )
-                return self._generate_fallback_verses(battle, round_obj)
+                for (side, rapper_name, _, _), content in zip(
+                    failed_sides, retried_contents
+                ):
+                    if isinstance(content, Exception):
+                        logger.warning(
+                            "Retry for %s failed in round %s: %s",
+                            rapper_name,
+                            round_obj.round_number,
+                            content,
+                        )
+                        continue
+                    contents[side] = content
+
+            rapper1_verse = self._build_verse(
+                round_obj,
+                battle.rapper1_name,
+                contents.get("rapper1"),
+            )
+            rapper2_verse = self._build_verse(
+                round_obj,
+                battle.rapper2_name,
+                contents.get("rapper2"),
+            )
 
             logger.info(
-                f"Successfully generated verses for round {round_obj.round_number}"
+                "Successfully generated verses for round %s", round_obj.round_number
             )
             return rapper1_verse, rapper2_verse
 
         except Exception as e:
             logger.error(
-                f"Error generating verses for round {round_obj.round_number}: {str(e)}"
+                "Error generating verses for round %s: %s", round_obj.round_number, e
             )
             return self._generate_fallback_verses(battle, round_obj)
 
+    @staticmethod
+    def _is_failed_verse(content: Optional[str]) -> bool:
+        """
+        Check whether verse content is missing or an agent error message.
+
+        Args:
+            content: Verse content returned by the rapper agent
+
+        Returns:
+            bool: True if the verse needs to be regenerated
+        """
+        return not content or content.startswith(FAILED_VERSE_PREFIXES)
+
+    def _build_verse(
+        self, round_obj: Round, rapper_name: str, content: Optional[str]
+    ) -> Verse:
+        """
+        Build a rapper's verse, using fallback lines if generation failed.
+
+        Args:
+            round_obj: The round object
+            rapper_name: Name of the rapper
+            content: Generated verse content, if any
+
+        Returns:
+            Verse: The generated verse, or a fallback verse for this rapper only
+        """
+        if self._is_failed_verse(content):
+            logger.warning(
+                "Failed to generate verse for %s in round %s, using fallback",
+                rapper_name,
+                round_obj.round_number,
+            )
+            content = self._fallback_verse_content()
+
+        return Verse.model_construct(
+            round_id=round_obj.id,
+            rapper_name=rapper_name,
+            content=content,
+        )
+
+    @staticmethod
+    def _fallback_verse_content() -> str:
+        """
+        Get a fallback verse made of randomly chosen stock lines.
+
+        Returns:
+            str: Four fallback lines joined by newlines
+        """
+        return "\n".join(random.sample(FALLBACK_VERSE_LINES, 4))
+
     def _generate_fallback_verses(
         self, battle: BattleResponse, round_obj: Round
     ) -> Tuple[Verse, Verse]:
@@ -97,29 +206,18 @@ class VerseGenerationService:
         Returns:
             Tuple[Verse, Verse]: Fallback verses for both rappers
         """
-        logger.info(f"Generating fallback verses for round {round_obj.round_number}")
-
-        fallback_lines = [
-            "I'm the king of this game, no one can compete",
-            "My rhymes are so fire, they can't be beat",
-            "Step to me wrong and you'll face defeat",
-            "I'm on another level, my flow's so neat",
-            "Respect my name, I'm elite on the street",
-            "My words cut deep, my verses are sweet",
-            "You can't match my style, accept your defeat",
-            "I rise to the top, that's my main feat",
-        ]
-
-        rapper1_content = "\n".join(random.sample(fallback_lines, 4))
-        rapper2_content = "\n".join(random.sample(fallback_lines, 4))
-
-        rapper1_verse = Verse(
+        logger.info("Generating fallback verses for round %s", round_obj.round_number)
+
+        rapper1_content = self._fallback_verse_content()
+        rapper2_content = self._fallback_verse_content()
+
+        rapper1_verse = Verse.model_construct(
             round_id=round_obj.id,
             rapper_name=battle.rapper1_name,
             content=rapper1_content,
         )
 
-        rapper2_verse = Verse(
+        rapper2_verse = Verse.model_construct(
             round_id=round_obj.id,
             rapper_name=battle.rapper2_name,
             content=rapper2_content,
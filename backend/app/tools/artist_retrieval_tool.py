@@ -2,6 +2,7 @@
 Artist retrieval tool for accessing vector store data during agent execution.
 """
 
+import asyncio
 import logging
 from typing import List, Optional
 
@@ -38,8 +39,6 @@ class ArtistRetrievalTool(BaseTool):
         Returns:
             Formatted string with artist data and lyrics
         """
-        import asyncio
-
         try:
             loop = asyncio.get_event_loop()
             return loop.run_until_complete(
@@ -2,13 +2,48 @@
 Common utility functions used across the application.
 """
 
-import re
+import functools
+import inspect
+import logging
+import os
+import time
+from collections import deque
 from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, TypeVar
+from uuid import UUID
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_UTC = timezone.utc
+
+_UUID_POOL_BYTES = 4096
+_uuid_pool: Deque[UUID] = deque()
 
 
 def utc_now() -> datetime:
     """Get current UTC time with timezone information."""
-    return datetime.now(timezone.utc)
+    return datetime.fromtimestamp(time.time(), _UTC)
+
+
+def pooled_uuid4() -> UUID:
+    """
+    Get a random version 4 UUID from a pool filled in batches.
+
+    The pool is refilled from a single os.urandom call instead of one call
+    per UUID. deque.popleft is atomic, so concurrent callers never share a UUID.
+
+    Returns:
+        UUID: Random version 4 UUID
+    """
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        entropy = os.urandom(_UUID_POOL_BYTES)
+        _uuid_pool.extend(
+            UUID(bytes=entropy[offset : offset + 16], version=4)
+            for offset in range(16, _UUID_POOL_BYTES, 16)
+        )
+        return UUID(bytes=entropy[:16], version=4)
 
 
 def clean_lyrics_text(text: str) -> str:
@@ -24,10 +59,77 @@ def clean_lyrics_text(text: str) -> str:
     if not isinstance(text, str):
         return str(text) if text is not None else ""
 
-    cleaned = re.sub(r"[\r\n]+", " ", text)
+    return " ".join(text.split())
+
+
+def describe_fields(
+    properties: Dict[str, Dict[str, Any]],
+) -> Callable[[Dict[str, Any]], None]:
+    """
+    Build a json_schema_extra hook that adds documentation to model properties.
+
+    Lets models declare fields as plain annotations while the descriptions and
+    examples still appear in the generated JSON schema.
+
+    Args:
+        properties: Mapping of field name to extra JSON schema keywords
+
+    Returns:
+        Callable[[Dict[str, Any]], None]: Hook for a model's json_schema_extra
+    """
+
+    def add_field_docs(schema: Dict[str, Any]) -> None:
+        schema_properties = schema.get("properties", {})
+        for field_name, extra in properties.items():
+            if field_name in schema_properties:
+                schema_properties[field_name].update(extra)
+
+    return add_field_docs
+
+
+def log_errors(logger: logging.Logger, message: str) -> Callable[[F], F]:
+    """
+    Decorate a function to log any exception it raises before re-raising it.
+
+    The message is formatted with the call's bound arguments only when an
+    error occurs, so successful calls pay no formatting cost.
+
+    Args:
+        logger: Logger to report errors to
+        message: Error message template, e.g. "Failed to get battle {battle_id}"
+
+    Returns:
+        Callable[[F], F]: Decorator for sync or async functions
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        def log_failure(args: tuple, kwargs: dict, error: Exception) -> None:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            logger.error("%s: %s", message.format(**bound.arguments), error)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    log_failure(args, kwargs, e)
+                    raise
+
+            return async_wrapper
 
-    cleaned = re.sub(r"\s+", " ", cleaned)
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                log_failure(args, kwargs, e)
+                raise
 
-    cleaned = cleaned.strip()
+        return wrapper
 
-    return cleaned
+    return decorator
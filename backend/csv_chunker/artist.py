@@ -23,6 +23,12 @@ class ProcessingResult(BaseModel):
         ..., description="Number of successfully processed records"
     )
     failed_records: int = Field(..., description="Number of failed records")
+    success_rate: float = Field(
+        default=0.0, description="Percentage of records processed successfully"
+    )
+    completed: bool = Field(
+        default=True, description="Whether the whole file was read and processed"
+    )
     errors: List[str] = Field(
         default_factory=list, description="List of error messages"
     )
@@ -11,9 +11,6 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-sys.path.append(str(Path(__file__).parent.parent))
-from app.utils.common import clean_lyrics_text
-
 
 class CSVMerger:
     """Handles merging of artist and song CSV files."""
@@ -23,6 +20,22 @@ class CSVMerger:
         self.songs_df: Optional[pd.DataFrame] = None
         self.merged_df: Optional[pd.DataFrame] = None
 
+    @staticmethod
+    def _clean_lyrics_column(lyrics: pd.Series) -> pd.Series:
+        """
+        Clean a column of lyrics using vectorized string operations.
+
+        Collapses newlines and runs of whitespace into single spaces, like
+        clean_lyrics_text, with missing values becoming empty strings.
+
+        Args:
+            lyrics: Column of raw lyrics
+
+        Returns:
+            pd.Series: Column of cleaned lyrics
+        """
+        return lyrics.fillna("").astype(str).str.split().str.join(" ")
+
     def load_artists_csv(self, file_path: str) -> None:
         """
         Load the artists CSV file with proper Unicode handling.
@@ -94,7 +107,9 @@ class CSVMerger:
 
             if "Lyric" in self.songs_df.columns:
                 print("Cleaning lyrics text...")
-                self.songs_df["Lyric"] = self.songs_df["Lyric"].apply(clean_lyrics_text)
+                self.songs_df["Lyric"] = self._clean_lyrics_column(
+                    self.songs_df["Lyric"]
+                )
                 print("✓ Lyrics text cleaned")
 
         except Exception as e:
@@ -147,8 +162,8 @@ class CSVMerger:
         try:
             if "Lyric" in self.merged_df.columns:
                 print("Final cleaning of lyrics text before saving...")
-                self.merged_df["Lyric"] = self.merged_df["Lyric"].apply(
-                    clean_lyrics_text
+                self.merged_df["Lyric"] = self._clean_lyrics_column(
+                    self.merged_df["Lyric"]
                 )
 
             self.merged_df.to_csv(
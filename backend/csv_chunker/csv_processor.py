@@ -1,63 +1,112 @@
 """
-CSV processing service for artist data using LangChain components.
+CSV processing service for artist data.
 """
 
 import asyncio
-import tempfile
-import chardet
-import re
+import codecs
+import csv
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, AsyncGenerator
-
-from langchain_community.document_loaders.csv_loader import CSVLoader
-from langchain_core.documents import Document
-from langchain_openai import OpenAIEmbeddings
-from pydantic import ValidationError
-
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+from chardet import UniversalDetector
+from pydantic import TypeAdapter, ValidationError
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from app.core.config import settings
+from app.utils.common import clean_lyrics_text
 from csv_chunker.artist import ArtistData, ProcessingResult
 from app.services.vector_store_service import vector_store_service
 
+ENCODING_SAMPLE_SIZE = 10000
+ENCODING_CHUNK_SIZE = 2048
+ENCODING_PROBE_CHUNK_SIZE = 65536
+CSV_FIELDNAMES = ["Artist", "Genres", "Songs", "Lyric"]
+COMMON_ENCODINGS = ("utf-8", "utf-8-sig", "latin1", "cp1252", "iso-8859-1")
+COMMON_ENCODINGS_LOWER = frozenset(COMMON_ENCODINGS)
+MALFORMED_ROW_ERROR = "Skipped row with empty artist or non-numeric song count"
 
-class CSVProcessorService:
-    """Service for processing CSV files with artist data."""
+_ARTIST_BATCH_ADAPTER = TypeAdapter(List[ArtistData])
 
-    def __init__(self):
-        """Initialize the CSV processor service."""
-        self.embeddings = OpenAIEmbeddings(
-            model="text-embedding-3-small", api_key=settings.openai_api_key
-        )
 
-    @staticmethod
-    def clean_lyrics_text(text: str) -> str:
-        """
-        Clean lyrics text by removing newline characters and handling special characters.
+@lru_cache(maxsize=32)
+def _get_encoding_fallbacks(detected_encoding: Optional[str]) -> Tuple[str, ...]:
+    """
+    Get the encodings to try, starting with the detected one.
 
-        Args:
-            text: Raw lyrics text that may contain newlines
+    Args:
+        detected_encoding: The encoding detected by chardet
 
-        Returns:
-            str: Cleaned lyrics text suitable for CSV storage
-        """
-        if not isinstance(text, str):
-            return str(text) if text is not None else ""
+    Returns:
+        Tuple[str, ...]: Encodings to try in order
+    """
+    if not detected_encoding:
+        return COMMON_ENCODINGS
+
+    detected = detected_encoding.lower()
+    if detected not in COMMON_ENCODINGS_LOWER:
+        return (detected_encoding,) + COMMON_ENCODINGS
 
-        cleaned = re.sub(r"[\r\n]+", " ", text)
+    return (detected_encoding,) + tuple(
+        enc for enc in COMMON_ENCODINGS if enc != detected
+    )
 
-        cleaned = re.sub(r"\s+", " ", cleaned)
 
-        cleaned = cleaned.strip()
+@lru_cache(maxsize=32)
+def _get_fallback_error_handler(fallback_encodings: Tuple[str, ...]) -> str:
+    """
+    Register a codec error handler that decodes bytes with fallback encodings.
 
-        return cleaned
+    The handler decodes each span of bytes the reading encoding rejects with
+    the first fallback encoding that accepts it, so a file whose start fits
+    the probed encoding can still be read to the end in a single pass.
+
+    Args:
+        fallback_encodings: Encodings to try in order for undecodable bytes
+
+    Returns:
+        str: Name of the registered error handler, for the errors argument of open
+    """
+    name = "csv_fallback:" + ",".join(fallback_encodings)
+
+    def decode_with_fallback(error: UnicodeError) -> Tuple[str, int]:
+        if not isinstance(error, UnicodeDecodeError):
+            raise error
+
+        undecodable = error.object[error.start : error.end]
+        for encoding in fallback_encodings:
+            try:
+                return undecodable.decode(encoding), error.end
+            except (UnicodeError, LookupError):
+                continue
+        raise error
+
+    codecs.register_error(name, decode_with_fallback)
+    return name
+
+
+class CSVProcessorService:
+    """Service for processing CSV files with artist data."""
 
     def _detect_encoding(self, file_path: str) -> str:
         """
         Detect the encoding of a file using chardet.
 
+        The file start is fed to the detector in small chunks, stopping as soon
+        as it is confident or the sample limit is reached.
+
         Args:
             file_path: Path to the file
 
@@ -65,183 +114,217 @@ class CSVProcessorService:
             str: Detected encoding or 'utf-8' as fallback
         """
         try:
+            detector = UniversalDetector()
             with open(file_path, "rb") as file:
-                raw_data = file.read(10000)
-                result = chardet.detect(raw_data)
-                encoding = result.get("encoding", "utf-8")
-                confidence = result.get("confidence", 0)
+                for _ in range(0, ENCODING_SAMPLE_SIZE, ENCODING_CHUNK_SIZE):
+                    chunk = file.read(ENCODING_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    detector.feed(chunk)
+                    if detector.done:
+                        break
+            detector.close()
 
-                if confidence < 0.7:
-                    encoding = "utf-8"
+            result = detector.result
+            encoding = result.get("encoding") or "utf-8"
+            confidence = result.get("confidence", 0)
 
-                return encoding
+            if confidence < 0.7:
+                encoding = "utf-8"
+
+            return encoding
         except Exception:
             return "utf-8"
 
-    def _get_encoding_fallbacks(self, detected_encoding: str) -> List[str]:
+    def _probe_encoding(self, file_path: str, encodings: Tuple[str, ...]) -> str:
         """
-        Get a list of encodings to try, starting with the detected one.
+        Find the first encoding that can decode the start of a file.
+
+        Only the first ENCODING_PROBE_CHUNK_SIZE bytes are probed. Bytes later
+        in the file that the chosen encoding rejects are handled while the
+        file is read, by the fallback error handler.
 
         Args:
-            detected_encoding: The encoding detected by chardet
+            file_path: Path to the file
+            encodings: Encodings to try in order
 
         Returns:
-            List[str]: List of encodings to try in order
+            str: First encoding that decodes the probed prefix
+
+        Raises:
+            UnicodeError: If no encoding can decode the prefix
         """
+        with open(file_path, "rb") as file:
+            prefix = file.read(ENCODING_PROBE_CHUNK_SIZE)
 
-        common_encodings = ["utf-8", "utf-8-sig", "latin1", "cp1252", "iso-8859-1"]
-
-        if detected_encoding and detected_encoding.lower() not in [
-            enc.lower() for enc in common_encodings
-        ]:
-            return [detected_encoding] + common_encodings
-
-        if detected_encoding:
-            encodings = [detected_encoding]
-            encodings.extend(
-                [
-                    enc
-                    for enc in common_encodings
-                    if enc.lower() != detected_encoding.lower()
-                ]
-            )
-            return encodings
+        last_error = None
+        for encoding in encodings:
+            try:
+                # Incremental so a character split at the prefix end is not an error
+                codecs.getincrementaldecoder(encoding)().decode(prefix)
+                return encoding
+            except (UnicodeError, LookupError) as e:
+                last_error = e
 
-        return common_encodings
+        raise UnicodeError(
+            f"Failed to decode file with any encoding. Last error: {str(last_error)}"
+        )
 
-    async def process_csv_file(self, file_path: str) -> ProcessingResult:
+    async def process_csv_file(
+        self, file_path: str, batch_size: int = 50
+    ) -> ProcessingResult:
         """
         Process a CSV file and return processing results with proper encoding handling.
 
+        If the file cannot be read to the end, the result is marked as not
+        completed. Its counts then only cover the rows read before the error.
+
         Args:
             file_path: Path to the CSV file
+            batch_size: Number of records embedded and upserted per vector store call
 
         Returns:
             ProcessingResult: Summary of processing results
+
+        Raises:
+            ValueError: If batch_size is less than 1
         """
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be at least 1, got {batch_size}")
+
         total_records = 0
         successful_records = 0
         failed_records = 0
         errors = []
+        completed = True
 
         try:
             detected_encoding = self._detect_encoding(file_path)
-            encodings_to_try = self._get_encoding_fallbacks(detected_encoding)
-
-            loader = None
-            successful_encoding = None
-
-            for encoding in encodings_to_try:
-                try:
-                    loader = CSVLoader(
-                        file_path=file_path,
-                        encoding=encoding,
-                        csv_args={
-                            "delimiter": ",",
-                            "quotechar": '"',
-                            "fieldnames": ["Artist", "Genres", "Songs", "Lyric"],
-                        },
-                    )
-
-                    test_docs = list(loader.lazy_load())
-                    if test_docs:
-                        successful_encoding = encoding
-                        break
-
-                except (UnicodeDecodeError, UnicodeError) as e:
-                    if encoding == encodings_to_try[-1]:
-                        errors.append(
-                            f"Failed to decode file with any encoding. Last error: {str(e)}"
-                        )
-                        raise
-                    continue
-                except Exception as e:
-                    if encoding == encodings_to_try[-1]:
-                        errors.append(
-                            f"Failed to load CSV with encoding {encoding}: {str(e)}"
-                        )
-                        raise
-                    continue
-
-            if not loader or not successful_encoding:
-                raise Exception("Could not find a suitable encoding for the CSV file")
-
-            print(f"✓ Successfully loaded CSV with {successful_encoding} encoding")
-
-            async for batch_result in self._process_csv_in_batches(loader):
-                total_records += batch_result["total"]
-                successful_records += batch_result["successful"]
-                failed_records += batch_result["failed"]
-                errors.extend(batch_result["errors"])
+            encodings_to_try = _get_encoding_fallbacks(detected_encoding)
+
+            successful_encoding = self._probe_encoding(file_path, encodings_to_try)
+            fallback_encodings = encodings_to_try[
+                encodings_to_try.index(successful_encoding) + 1 :
+            ]
+
+            with open(
+                file_path,
+                newline="",
+                encoding=successful_encoding,
+                errors=_get_fallback_error_handler(fallback_encodings),
+            ) as file:
+                print(f"✓ Successfully loaded CSV with {successful_encoding} encoding")
+
+                async for batch_result in self._process_csv_in_batches(
+                    self._read_csv_rows(file), batch_size
+                ):
+                    total_records += batch_result["total"]
+                    successful_records += batch_result["successful"]
+                    failed_records += batch_result["failed"]
+                    errors.extend(batch_result["errors"])
 
         except Exception as e:
             errors.append(f"Failed to process CSV file: {str(e)}")
-            failed_records = total_records if total_records > 0 else 1
+            completed = False
+            if total_records == 0:
+                failed_records = 1
 
         return ProcessingResult(
             total_records=total_records,
             successful_records=successful_records,
             failed_records=failed_records,
+            success_rate=(
+                successful_records * 100.0 / total_records if total_records else 0.0
+            ),
+            completed=completed,
             errors=errors,
             collection_name=settings.qdrant_artists_collection_name,
         )
 
+    def _read_csv_rows(self, file: TextIO) -> Iterator[Dict[str, str]]:
+        """
+        Read artist rows from an open CSV file, skipping the header row if present.
+
+        Args:
+            file: CSV file opened in text mode with newline=""
+
+        Yields:
+            Dict[str, str]: Row values keyed by CSV_FIELDNAMES
+        """
+        rows = csv.DictReader(
+            file, fieldnames=CSV_FIELDNAMES, delimiter=",", quotechar='"'
+        )
+
+        first_row = next(rows, None)
+        if first_row is not None and list(first_row.values()) != CSV_FIELDNAMES:
+            yield first_row
+
+        yield from rows
+
     async def _process_csv_in_batches(
-        self, loader: CSVLoader, batch_size: int = 50
+        self, rows: Iterable[Dict[str, str]], batch_size: int = 50
     ) -> AsyncGenerator[dict, None]:
         """
-        Process CSV documents in batches for better memory management.
+        Process CSV rows in batches for better memory management.
+
+        Up to embedding_max_concurrency batches are processed at once. Reading
+        pauses while that many are in flight, so memory stays bounded.
 
         Args:
-            loader: Configured CSVLoader instance
-            batch_size: Number of documents to process in each batch
+            rows: CSV rows keyed by column name
+            batch_size: Number of rows to process in each batch
 
         Yields:
-            dict: Batch processing results
+            dict: Batch processing results, in completion order
+
+        Raises:
+            Exception: If reading the rows fails, after the batches already
+                read have been processed and yielded
         """
         batch = []
-        batch_results = {"total": 0, "successful": 0, "failed": 0, "errors": []}
+        pending = set()
+        read_error = None
 
         try:
-            for document in loader.lazy_load():
-                batch.append(document)
-                batch_results["total"] += 1
+            for row in rows:
+                batch.append(row)
 
                 if len(batch) >= batch_size:
-                    batch_result = await self._process_document_batch(batch)
-                    batch_results["successful"] += batch_result["successful"]
-                    batch_results["failed"] += batch_result["failed"]
-                    batch_results["errors"].extend(batch_result["errors"])
-
-                    yield batch_results.copy()
+                    if len(pending) >= settings.embedding_max_concurrency:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in done:
+                            yield task.result()
 
+                    pending.add(asyncio.create_task(self._process_row_batch(batch)))
                     batch = []
-                    batch_results = {
-                        "total": 0,
-                        "successful": 0,
-                        "failed": 0,
-                        "errors": [],
-                    }
 
-            if batch:
-                batch_result = await self._process_document_batch(batch)
-                batch_results["successful"] += batch_result["successful"]
-                batch_results["failed"] += batch_result["failed"]
-                batch_results["errors"].extend(batch_result["errors"])
+        except Exception as e:
+            read_error = e
 
-                yield batch_results
+        if batch:
+            pending.add(asyncio.create_task(self._process_row_batch(batch)))
 
-        except Exception as e:
-            batch_results["errors"].append(f"Error during batch processing: {str(e)}")
-            batch_results["failed"] = batch_results["total"]
-            yield batch_results
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
 
-    async def _process_document_batch(self, documents: List[Document]) -> dict:
+        if read_error:
+            raise read_error
+
+    async def _process_row_batch(self, rows: List[Dict[str, str]]) -> dict:
         """
-        Process a batch of documents.
+        Process a batch of CSV rows.
+
+        The whole batch is validated in one call. Rows are only validated one
+        by one, to report which ones are invalid, when that call fails.
 
         Args:
-            documents: List of Document objects from CSV
+            rows: CSV rows keyed by column name
 
         Returns:
             dict: Batch processing results
@@ -249,19 +332,25 @@ class CSVProcessorService:
         successful = 0
         failed = 0
         errors = []
-        artist_data_batch = []
+        artist_fields = []
 
-        for doc in documents:
-            try:
-                artist_data = self._parse_document_to_artist_data(doc)
-                artist_data_batch.append(artist_data)
-
-            except ValidationError as e:
-                failed += 1
-                errors.append(f"Validation error for document: {str(e)}")
-            except Exception as e:
+        for row in rows:
+            if self._is_row_shape_ok(row):
+                artist_fields.append(self._row_to_artist_fields(row))
+            else:
                 failed += 1
-                errors.append(f"Parsing error for document: {str(e)}")
+                errors.append(MALFORMED_ROW_ERROR)
+
+        try:
+            artist_data_batch = _ARTIST_BATCH_ADAPTER.validate_python(artist_fields)
+        except ValidationError:
+            artist_data_batch = []
+            for fields in artist_fields:
+                try:
+                    artist_data_batch.append(ArtistData.model_validate(fields))
+                except ValidationError as e:
+                    failed += 1
+                    errors.append(f"Validation error for row: {str(e)}")
 
         if artist_data_batch:
             try:
@@ -274,36 +363,60 @@ class CSVProcessorService:
                 failed += len(artist_data_batch)
                 errors.append(f"Vector store error for batch: {str(e)}")
 
-        return {"successful": successful, "failed": failed, "errors": errors}
+        return {
+            "total": len(rows),
+            "successful": successful,
+            "failed": failed,
+            "errors": errors,
+        }
 
-    def _parse_document_to_artist_data(self, document: Document) -> ArtistData:
+    @staticmethod
+    def _is_row_shape_ok(row: Dict[str, str]) -> bool:
         """
-        Parse a LangChain Document into an ArtistData model.
+        Cheaply check that a row can become ArtistData before full validation.
+
+        Rows such as blank lines would otherwise each build a costly
+        pydantic ValidationError.
 
         Args:
-            document: Document from CSVLoader
+            row: CSV row keyed by column name
 
         Returns:
-            ArtistData: Parsed and validated artist data
+            bool: True if the row has an artist and a numeric song count
+        """
+        if not (row.get("Artist") or "").strip():
+            return False
+
+        songs = row.get("Songs")
+        if songs is None:
+            return True
+
+        try:
+            float(songs)
+        except ValueError:
+            return False
+        return True
+
+    def _row_to_artist_fields(self, row: Dict[str, str]) -> Dict[str, Any]:
         """
+        Map a CSV row to ArtistData fields, ready for validation.
 
-        content = document.page_content
+        Args:
+            row: CSV row keyed by column name
 
-        data = {}
-        for line in content.split("\n"):
-            if ":" in line:
-                key, value = line.split(":", 1)
-                data[key.strip()] = value.strip()
+        Returns:
+            Dict[str, Any]: Cleaned field values keyed by ArtistData field name
+        """
+        raw_lyric = (row.get("Lyric") or "").strip()
+        songs = row.get("Songs")
 
-        raw_lyric = data.get("Lyric", "")
-        cleaned_lyric = self.clean_lyrics_text(raw_lyric)
+        return {
+            "artist": (row.get("Artist") or "").strip(),
+            "genres": (row.get("Genres") or "").strip(),
+            "songs": songs.strip() if songs is not None else 0.0,
+            "lyric": clean_lyrics_text(raw_lyric),
+        }
 
-        return ArtistData(
-            artist=data.get("Artist", ""),
-            genres=data.get("Genres", ""),
-            songs=float(data.get("Songs", 0)),
-            lyric=cleaned_lyric,
-        )
 
 csv_processor_service = CSVProcessorService()
 
@@ -312,11 +425,17 @@ async def main():
     """Main function to run CSV processor as standalone script."""
     import argparse
 
+    def positive_int(value: str) -> int:
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+        return number
+
     parser = argparse.ArgumentParser(description="Process CSV files with artist data")
     parser.add_argument("file_path", help="Path to the CSV file to process")
     parser.add_argument(
         "--batch-size",
-        type=int,
+        type=positive_int,
         default=50,
         help="Number of records to process in each batch (default: 50)",
     )
@@ -332,7 +451,9 @@ async def main():
     print("-" * 50)
 
     try:
-        result = await csv_processor_service.process_csv_file(args.file_path)
+        result = await csv_processor_service.process_csv_file(
+            args.file_path, batch_size=args.batch_size
+        )
 
         print("\n" + "=" * 50)
         print("PROCESSING RESULTS")
@@ -340,11 +461,7 @@ async def main():
         print(f"Total records processed: {result.total_records}")
         print(f"Successful records: {result.successful_records}")
         print(f"Failed records: {result.failed_records}")
-        print(
-            f"Success rate: {(result.successful_records / result.total_records * 100):.1f}%"
-            if result.total_records > 0
-            else "0%"
-        )
+        print(f"Success rate: {result.success_rate:.1f}%")
         print(f"Collection name: {result.collection_name}")
 
         if result.errors:
@@ -354,6 +471,10 @@ async def main():
             if len(result.errors) > 10:
                 print(f"  ... and {len(result.errors) - 10} more errors")
 
+        if not result.completed:
+            print("\n✗ Processing stopped before the end of the file")
+            sys.exit(1)
+
         print("\n✓ Processing completed successfully!")
 
     except Exception as e:
@@ -4,6 +4,7 @@ Main application entry point
 """
 
 from contextlib import asynccontextmanager
+from typing import Dict
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -75,7 +76,7 @@ app.add_middleware(
 
 
 @app.get("/")
-async def root():
+async def root() -> Dict[str, str]:
     """Root endpoint to check if the API is running."""
     return {"message": "Welcome to RAGERaps API", "status": "online"}
 
@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration for the backend tests.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-api-key")
+os.environ.setdefault("TAVILY_API_KEY", "test-tavily-api-key")
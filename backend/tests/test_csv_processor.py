@@ -0,0 +1,109 @@
+"""
+Tests for the CSV processor.
+"""
+
+import asyncio
+import csv
+
+import pytest
+
+from csv_chunker import csv_processor
+from csv_chunker.csv_processor import (
+    ENCODING_PROBE_CHUNK_SIZE,
+    csv_processor_service,
+)
+
+
+def _write_csv_with_late_latin1(path, rows=1000):
+    """Write an ASCII CSV whose only non-ASCII byte is past the first probe chunk."""
+    lines = ["Artist,Genres,Songs,Lyric"]
+    lines += [
+        f'Artist{i},Rap,{i},"plain ascii lyric number {i} with some padding text"'
+        for i in range(rows)
+    ]
+    lines.append('Beyonce,Pop,5,"café at the end"')
+    data = ("\n".join(lines) + "\n").encode("latin-1")
+    assert data.index("é".encode("latin-1")) > ENCODING_PROBE_CHUNK_SIZE
+    path.write_bytes(data)
+
+
+def test_probe_encoding_only_reads_the_first_chunk(tmp_path, monkeypatch):
+    csv_path = tmp_path / "artists.csv"
+    _write_csv_with_late_latin1(csv_path)
+    read_sizes = []
+    real_open = open
+
+    def recording_open(*args, **kwargs):
+        file = real_open(*args, **kwargs)
+        real_read = file.read
+        file.read = lambda size=-1: read_sizes.append(size) or real_read(size)
+        return file
+
+    monkeypatch.setattr("builtins.open", recording_open)
+
+    encoding = csv_processor_service._probe_encoding(
+        str(csv_path), ("ascii", "utf-8", "latin1")
+    )
+
+    assert encoding == "ascii"
+    assert read_sizes == [ENCODING_PROBE_CHUNK_SIZE]
+
+
+def test_process_csv_file_imports_rows_after_late_non_ascii_byte(tmp_path, monkeypatch):
+    csv_path = tmp_path / "artists.csv"
+    _write_csv_with_late_latin1(csv_path)
+    stored = []
+
+    async def add_artist_data_batch(artist_data_list):
+        stored.extend(artist_data_list)
+        return [str(i) for i in range(len(artist_data_list))]
+
+    monkeypatch.setattr(
+        csv_processor.vector_store_service,
+        "add_artist_data_batch",
+        add_artist_data_batch,
+    )
+
+    result = asyncio.run(csv_processor_service.process_csv_file(str(csv_path)))
+
+    assert result.errors == []
+    assert result.total_records == 1001
+    assert result.successful_records == 1001
+    assert result.failed_records == 0
+    assert stored[-1].lyric == "café at the end"
+
+
+def test_process_csv_file_reports_mid_file_read_error(tmp_path, monkeypatch):
+    csv_path = tmp_path / "artists.csv"
+    lines = ["Artist,Genres,Songs,Lyric"]
+    lines += [f'Artist{i},Rap,{i},"lyric {i}"' for i in range(120)]
+    lines.append(f'Huge,Rap,1,"{"x" * (csv.field_size_limit() + 1)}"')
+    lines += [f'Later{i},Rap,{i},"lyric {i}"' for i in range(30)]
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    async def add_artist_data_batch(artist_data_list):
+        return [str(i) for i in range(len(artist_data_list))]
+
+    monkeypatch.setattr(
+        csv_processor.vector_store_service,
+        "add_artist_data_batch",
+        add_artist_data_batch,
+    )
+
+    result = asyncio.run(csv_processor_service.process_csv_file(str(csv_path)))
+
+    assert not result.completed
+    assert result.total_records == 120
+    assert result.successful_records == 120
+    assert result.errors[-1].startswith("Failed to process CSV file:")
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_process_csv_file_rejects_non_positive_batch_size(tmp_path, batch_size):
+    csv_path = tmp_path / "artists.csv"
+    csv_path.write_text('Artist,Genres,Songs,Lyric\nNas,Rap,1,"lyric"\n')
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            csv_processor_service.process_csv_file(str(csv_path), batch_size=batch_size)
+        )
@@ -0,0 +1,70 @@
+"""
+Tests for the vector store service search cache.
+"""
+
+import asyncio
+
+from langchain_core.documents import Document
+
+from app.services.vector_store_service import VectorStoreService
+
+
+def _service_with_fake_search(calls):
+    """Build a service whose uncached search returns one document per call."""
+    service = VectorStoreService()
+
+    async def fake_search(query, k):
+        calls.append((query, k))
+        await asyncio.sleep(0.01)
+        results = [Document(page_content=f"{query} lyrics")]
+        service._search_cache[(query, k)] = (float("inf"), results)
+        return results
+
+    service._search_artists_uncached = fake_search
+    return service
+
+
+def test_search_artists_shares_in_flight_searches_on_one_loop():
+    calls = []
+    service = _service_with_fake_search(calls)
+
+    async def search_twice():
+        return await asyncio.gather(
+            service.search_artists("Nas", 3), service.search_artists("Nas", 3)
+        )
+
+    first, second = asyncio.run(search_twice())
+
+    assert calls == [("Nas", 3)]
+    assert first == second
+    assert first is not second
+
+
+def test_search_artists_does_not_share_searches_across_event_loops():
+    calls = []
+    service = _service_with_fake_search(calls)
+    other_loop = asyncio.new_event_loop()
+    try:
+        in_flight = other_loop.create_task(service.search_artists("Nas", 3))
+        other_loop.run_until_complete(asyncio.sleep(0))
+
+        results = asyncio.run(service.search_artists("Nas", 3))
+
+        other_loop.run_until_complete(in_flight)
+    finally:
+        other_loop.close()
+
+    assert results == [Document(page_content="Nas lyrics")]
+    assert calls == [("Nas", 3), ("Nas", 3)]
+
+
+def test_search_artists_returns_copies_of_cached_results():
+    calls = []
+    service = _service_with_fake_search(calls)
+
+    first = asyncio.run(service.search_artists("Nas", 3))
+    first.clear()
+    second = asyncio.run(service.search_artists("Nas", 3))
+
+    assert len(second) == 1
+    assert calls == [("Nas", 3)]